@@ -0,0 +1,90 @@
+# cython: language_level=3
+"""Compiled answer matching for vocab_trainer (optional).
+
+A C port of the loop in vocab_trainer.similar_enough: exact match, then
+Levenshtein banded by each alternative's typo threshold. It is meant to
+give the same verdicts; tests/test_matching.py runs against whichever
+implementation match_answer picks. Strings are compared as UTF-32 code
+units, so accented or non-Latin text needs no fallback.
+
+Build in place with: python setup.py build_ext --inplace
+"""
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+
+cdef enum:
+    STACK_ROW = 256  # alternatives shorter than this need no heap buffer
+
+
+cdef int _lev_c(const unsigned int* a, int la, const unsigned int* b, int lb,
+                int budget, int* buf) noexcept nogil:
+    # banded Levenshtein, budget + 1 once the distance exceeds budget;
+    # buf holds two rows of lb + 1 ints
+    cdef int over = budget + 1
+    cdef int i, j, lo, hi, d, row_min
+    cdef int* prev = buf
+    cdef int* curr = buf + lb + 1
+    cdef int* tmp
+    if la - lb > budget or lb - la > budget:
+        return over
+    if la == 0 or lb == 0:
+        return max(la, lb)
+    for j in range(lb + 1):
+        prev[j] = j if j <= budget else over
+    for i in range(1, la + 1):
+        lo = max(1, i - budget)
+        hi = min(lb, i + budget)
+        # only the band and its two neighbours are ever read back
+        curr[0] = i if i <= budget else over
+        if lo > 1:
+            curr[lo - 1] = over
+        row_min = curr[0]
+        for j in range(lo, hi + 1):
+            d = prev[j] + 1
+            if curr[j - 1] + 1 < d:
+                d = curr[j - 1] + 1
+            if prev[j - 1] + (a[i - 1] != b[j - 1]) < d:
+                d = prev[j - 1] + (a[i - 1] != b[j - 1])
+            if d > over:
+                d = over
+            curr[j] = d
+            if d < row_min:
+                row_min = d
+        if hi < lb:
+            curr[hi + 1] = over
+        if row_min > budget:
+            return over
+        tmp = prev
+        prev = curr
+        curr = tmp
+    return prev[lb]
+
+
+cpdef bint match_answer(str given, object alts):
+    """given: normalized answer; alts: list of (normalized alt, threshold)."""
+    cdef bytes g_buf = given.encode('utf-32-le', 'surrogatepass')
+    cdef const unsigned int* g = <const unsigned int*><const char*>g_buf
+    cdef int lg = len(given)
+    cdef bytes a_buf
+    cdef const unsigned int* a
+    cdef int la, thr, d
+    cdef int stack_buf[2 * STACK_ROW]
+    cdef int* buf
+    cdef str alt
+    for alt, thr in alts:
+        if given == alt:
+            return True
+        a_buf = alt.encode('utf-32-le', 'surrogatepass')
+        a = <const unsigned int*><const char*>a_buf
+        la = len(alt)
+        if la < STACK_ROW:
+            buf = stack_buf
+        else:
+            buf = <int*>PyMem_Malloc(2 * (la + 1) * sizeof(int))
+            if buf == NULL:
+                raise MemoryError()
+        d = _lev_c(g, lg, a, la, thr, buf)
+        if buf != stack_buf:
+            PyMem_Free(buf)
+        if d <= thr:
+            return True
+    return False
@@ -0,0 +1,21 @@
+"""Optional build of the compiled answer matcher (match_answer.pyx).
+
+    pip install cython
+    python setup.py build_ext --inplace
+
+This only builds the extension next to vocab_trainer.py; the trainer itself
+is run from the checkout and is not installed by this file. vocab_trainer
+falls back to pure Python when the extension isn't built.
+"""
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    raise SystemExit('Building match_answer needs Cython: pip install cython')
+
+setup(
+    # named for the extension: `pip install .` would install nothing else
+    name='vocab-trainer-match-answer',
+    ext_modules=cythonize('match_answer.pyx', compiler_directives={'language_level': 3}),
+)
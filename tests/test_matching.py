@@ -0,0 +1,33 @@
+import pytest
+
+from vocab_trainer import _prep_alts, match_answer, similar_enough
+
+
+@pytest.mark.parametrize('given, expected', [
+    ('maison', 'maison'),
+    ('Maison', 'la maison, maison'),
+    ('eleve', 'élève'),
+    ('maisn', 'maison'),
+])
+def test_accepts_exact_and_small_typos(given, expected):
+    assert similar_enough(given, expected)
+    assert similar_enough(given, _prep_alts(expected))
+    assert match_answer(given, expected)
+    assert match_answer(given, _prep_alts(expected))
+
+
+# distinct vocabulary words within the typo threshold by Sift4's estimate but
+# not by edit distance; a Sift4 accept would grade them correct
+@pytest.mark.parametrize('given, expected', [
+    ('pari', 'prix'),
+    ('déjeuner', 'dépenser'),
+    ('gérer', 'genre'),
+    ('largement', 'autrement'),
+    ('contenu', 'reconnu'),
+    ('chat', 'chien'),
+])
+def test_rejects_other_words(given, expected):
+    assert not similar_enough(given, expected)
+    assert not similar_enough(given, _prep_alts(expected))
+    assert not match_answer(given, expected)
+    assert not match_answer(given, _prep_alts(expected))
@@ -0,0 +1,119 @@
+import json
+import sqlite3
+from contextlib import closing
+
+import pytest
+
+import vocab_trainer as vt
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    # point the trainer at an empty data dir with a cold cache
+    monkeypatch.setattr(vt, 'DATA_DIR', tmp_path)
+    monkeypatch.setattr(vt, 'WORDS_DB', tmp_path / 'words.db')
+    monkeypatch.setattr(vt, 'WORDS_JSON', tmp_path / 'words.json')
+    monkeypatch.setattr(vt, '_cache', dict.fromkeys(vt._cache))
+    return tmp_path
+
+
+def _add(*pairs):
+    words = vt.load_words()
+    vt._insert_words(words, vt._add_new(words, pairs))
+
+
+def _by_id(words):
+    return {w['id']: w for w in words}
+
+
+def _reload():
+    # read words.db again, as a new process would
+    vt._cache.update(dict.fromkeys(vt._cache))
+    return vt.load_words()
+
+
+def test_migrates_words_json_with_progress_and_duplicate_ids(store):
+    (store / 'words.json').write_text(json.dumps([
+        {'id': 1, 'en': 'cat', 'fr': 'chat', 'status': 'learning', 'ef': 2.6,
+         'interval': 6, 'repetitions': 2, 'due': '2024-05-01'},
+        {'id': 2, 'en': 'dog', 'fr': 'chien'},
+        {'id': 2, 'en': 'bird', 'fr': 'oiseau'},
+    ]), encoding='utf-8')
+    words = _reload()
+    assert (store / 'words.db').exists()
+    assert [(w['id'], w['en']) for w in words] == [(1, 'cat'), (2, 'dog'), (3, 'bird')]
+    cat = words[0]
+    assert (cat['status'], cat['ef'], cat['interval'], cat['repetitions'], cat['due']) == \
+        ('learning', 2.6, 6, 2, '2024-05-01')
+    assert words[1]['status'] == 'new'
+
+
+def test_failed_migration_leaves_no_database(store):
+    # an entry without 'fr' can't be stored
+    (store / 'words.json').write_text(json.dumps([{'id': 1, 'en': 'cat'}]),
+                                      encoding='utf-8')
+    for _ in range(2):
+        with pytest.raises(KeyError):
+            _reload()
+        assert sorted(p.name for p in store.iterdir()) == ['words.json']
+
+
+def test_saved_answer_survives_reload(store):
+    _add(('cat', 'chat'), ('dog', 'chien'))
+    item = _by_id(vt.load_words())[2]
+    vt.sm2_update(item, False)
+    vt.save_word(item)
+    stored = _by_id(_reload())
+    assert stored[2]['status'] == 'learning'
+    assert stored[2]['due'] == item['due']
+    assert stored[1]['status'] == 'new'
+
+
+def test_delete_word(store):
+    _add(('cat', 'chat'), ('dog', 'chien'))
+    assert not vt.delete_word(99)
+    assert vt.delete_word(1)
+    assert not vt.delete_word(1)
+    assert [w['id'] for w in vt.load_words()] == [2]
+    assert [w['id'] for w in _reload()] == [2]
+
+
+def test_sees_commits_from_another_process(store):
+    _add(('cat', 'chat'), ('dog', 'chien'))
+    words = vt.load_words()
+    # another process answers word 1 through its own connection
+    with closing(sqlite3.connect(vt.WORDS_DB)) as conn:
+        conn.execute("UPDATE words SET status='learning', repetitions=1 WHERE id=1")
+        conn.commit()
+    item = _by_id(words)[2]
+    vt.sm2_update(item, True)
+    vt.save_word(item)
+    reloaded = _by_id(vt.load_words())
+    assert reloaded[1]['status'] == 'learning'
+    assert reloaded[1]['repetitions'] == 1
+    assert reloaded[2]['repetitions'] == 1
+
+
+def test_delete_leaves_earlier_list_and_index_intact(store):
+    _add(('cat', 'chat'), ('dog', 'chien'), ('bird', 'oiseau'))
+    words = vt.load_words()
+    index = vt.search_index(words)
+    assert vt.status_counts(words)['new'] == 3
+    assert vt.delete_word(1)
+    # a request still holding the old list sees a consistent snapshot
+    assert [words[i]['en'] for _, i in index] == ['cat', 'dog', 'bird']
+    current = vt.load_words()
+    assert [current[i]['en'] for _, i in vt.search_index(current)] == ['dog', 'bird']
+    assert vt.status_counts(current)['new'] == 2
+
+
+def test_counts_ignore_entries_from_an_earlier_load(store):
+    _add(('cat', 'chat'), ('dog', 'chien'))
+    stale = vt.load_words()
+    vt._cache['key'] = None  # as after a commit from another process
+    current = vt.load_words()
+    assert vt.status_counts(current)['new'] == 2
+    vt.sm2_update(_by_id(stale)[1], True)
+    assert vt.status_counts(current) == {'new': 2, 'learning': 0, 'validated': 0}
+    vt.sm2_update(_by_id(current)[2], True)
+    assert vt.status_counts(current) == {'new': 1, 'learning': 1, 'validated': 0}
@@ -6,22 +6,69 @@ Usage:
   python3 vocab_trainer.py quiz
   python3 vocab_trainer.py stats
 
-This script stores data in ./data/words.json
+This script stores data in ./data/words.db (SQLite); an existing
+./data/words.json is imported into it on first run.
 """
 import argparse
 import csv
 import json
 import os
 import random
+import sqlite3
 import sys
+import threading
 import unicodedata
-from datetime import date, datetime, timedelta
+from collections import deque
+from contextlib import closing
+from datetime import date, datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see _read_json()/_write_json()
+    orjson = None
+
+try:
+    import stringzilla
+except ImportError:  # optional speedup, see similar_enough()
+    stringzilla = None
+# edit_distance only exists in StringZilla 3.x; later releases dropped it
+_sz_edit_distance = getattr(stringzilla, 'edit_distance', None)
+
+try:
+    # compiled similar_enough() loop, see match_answer.pyx / setup.py
+    from match_answer import match_answer as _match_answer_c
+except ImportError:
+    _match_answer_c = None
+
 ROOT = Path(__file__).resolve().parent
 DATA_DIR = ROOT / "data"
+WORDS_DB = DATA_DIR / "words.db"
+# pre-SQLite storage, migrated into WORDS_DB when that doesn't exist yet
 WORDS_JSON = DATA_DIR / "words.json"
 
+# combining-mark blocks, mapped to None so str.translate strips them in C
+_COMBINING_RANGES = (
+    (0x0300, 0x036F),  # Combining Diacritical Marks
+    (0x1AB0, 0x1AFF),  # ... Extended
+    (0x1DC0, 0x1DFF),  # ... Supplement
+    (0x20D0, 0x20FF),  # ... for Symbols
+    (0xFE20, 0xFE2F),  # Combining Half Marks
+)
+_COMBINING_TABLE = {
+    c: None
+    for lo, hi in _COMBINING_RANGES
+    for c in range(lo, hi + 1)
+    if unicodedata.combining(chr(c))
+}
+
+# rows of words.db, reused while the database on disk is unchanged
+# 'counts' holds per-status totals for 'data', kept up to date incrementally;
+# 'search' is the search_index() of 'data'; 'ids' maps id -> entry of 'data'
+_cache = {'key': None, 'data': None, 'counts': None, 'search': None, 'ids': None}
+# the web UI serves requests from several threads that share _cache
+_cache_lock = threading.RLock()
+
 def ensure_data_dir():
     DATA_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -29,40 +76,325 @@ def normalize(s: str) -> str:
     if s is None:
         return ""
     s = s.strip().lower()
+    # ASCII has no accents to strip, skip the Unicode tables entirely
+    if s.isascii():
+        return ' '.join(s.split())
     # remove accents
-    s = unicodedata.normalize('NFKD', s)
-    s = ''.join(ch for ch in s if not unicodedata.combining(ch))
+    s = unicodedata.normalize('NFKD', s).translate(_COMBINING_TABLE)
     # collapse spaces
     return ' '.join(s.split())
 
-def load_words():
+def _prep_alts(raw: str):
+    # comma-separated alternatives as (normalized text, typo threshold) pairs;
+    # threshold = 30% of length, at least 1
+    alts = []
+    for a in raw.split(','):
+        n = normalize(a)
+        if n:
+            alts.append((n, max(1, int(len(n) * 0.3))))
+    return alts
+
+def _prepare(w):
+    # ensure SRS fields exist for backwards compatibility
+    w.setdefault('status', 'new')
+    w.setdefault('ef', 2.5)
+    w.setdefault('interval', 0)
+    w.setdefault('repetitions', 0)
+    # due stored as ISO date string
+    if 'due' not in w or not w.get('due'):
+        w['due'] = date.today().isoformat()
+    # due as a date ordinal, so due checks are integer compares
+    try:
+        w['_due_ord'] = datetime.fromisoformat(w['due']).toordinal()
+    except (TypeError, ValueError):
+        w['_due_ord'] = date.today().toordinal()
+    # derived fields cached on the entry; '_'-prefixed keys are not saved
+    # (rows from words.db arrive with their stored normalized forms)
+    if '_en_norm' not in w:
+        w['_en_norm'] = normalize(w.get('en', ''))
+    if '_fr_norm' not in w:
+        w['_fr_norm'] = normalize(w.get('fr', ''))
+    w['_en_alts'] = _prep_alts(w.get('en', ''))
+    w['_fr_alts'] = _prep_alts(w.get('fr', ''))
+    # quiz prompts for both directions
+    w['_p_en2fr'] = f"Translate to French: {w.get('en', '')}\n> "
+    w['_p_fr2en'] = f"Translate to English: {w.get('fr', '')}\n> "
+    return w
+
+def _read_json(path):
+    if orjson is not None:
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _write_json(path, words):
+    # drop cached '_' fields so they don't end up in the JSON
+    data = [{k: v for k, v in w.items() if not k.startswith('_')} for w in words]
+    # smaller file and faster encoding, at the cost of readability
+    compact = os.environ.get('VOCAB_COMPACT') == '1'
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if not compact:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            if compact:
+                json.dump(data, f, ensure_ascii=False, indent=None, separators=(',', ':'))
+            else:
+                json.dump(data, f, ensure_ascii=False, indent=2)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS words(
+    id INTEGER PRIMARY KEY, en TEXT, fr TEXT, en_norm TEXT, fr_norm TEXT,
+    status TEXT, ef REAL, interval INTEGER, repetitions INTEGER, due INTEGER
+);
+"""
+_INSERT = "INSERT INTO words VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+
+def _row(w):
+    # due is stored as a date ordinal
+    return (w['id'], w['en'], w['fr'], w['_en_norm'], w['_fr_norm'],
+            w['status'], w['ef'], w['interval'], w['repetitions'], w['_due_ord'])
+
+def _from_row(row):
+    wid, en, fr, en_norm, fr_norm, status, ef, interval, reps, due = row
+    return _prepare({"id": wid, "en": en, "fr": fr, "status": status, "ef": ef,
+                     "interval": interval, "repetitions": reps,
+                     "due": date.fromordinal(due).isoformat(),
+                     "_en_norm": en_norm, "_fr_norm": fr_norm})
+
+def _migrate_json(conn):
+    # one-time import of a pre-SQLite words.json; older imports could
+    # produce repeated ids, which get fresh ones here
+    data = [_prepare(w) for w in _read_json(WORDS_JSON)]
+    next_id = max((w['id'] for w in data), default=0) + 1
+    used = set()
+    for w in data:
+        if w['id'] in used:
+            w['id'] = next_id
+            next_id += 1
+        used.add(w['id'])
+    conn.execute('BEGIN')
+    conn.executemany(_INSERT, [_row(w) for w in data])
+    conn.execute('COMMIT')
+
+def _build_db():
+    # create words.db (from words.json, if any) under a temporary name and
+    # rename it into place once complete, so a failed or interrupted first
+    # run leaves no half-built database that would hide words.json
+    tmp = WORDS_DB.with_name(WORDS_DB.name + '.tmp')
+    leftovers = (tmp, tmp.with_name(tmp.name + '-journal'))
+    for p in leftovers:
+        p.unlink(missing_ok=True)
+    try:
+        with closing(sqlite3.connect(tmp, isolation_level=None)) as conn:
+            conn.executescript(_SCHEMA)
+            if WORDS_JSON.exists():
+                _migrate_json(conn)
+        os.replace(tmp, WORDS_DB)
+    except BaseException:
+        for p in leftovers:
+            p.unlink(missing_ok=True)
+        raise
+
+def _db():
     ensure_data_dir()
-    if not WORDS_JSON.exists():
-        return []
-    with open(WORDS_JSON, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-        # ensure SRS fields exist for backwards compatibility
-        for w in data:
-            w.setdefault('status', 'new')
-            w.setdefault('ef', 2.5)
-            w.setdefault('interval', 0)
-            w.setdefault('repetitions', 0)
-            # due stored as ISO date string
-            if 'due' not in w or not w.get('due'):
-                w['due'] = date.today().isoformat()
-        return data
+    if not WORDS_DB.exists():
+        _build_db()
+    conn = sqlite3.connect(WORDS_DB, isolation_level=None)
+    conn.execute('PRAGMA journal_mode=WAL')
+    conn.execute('PRAGMA synchronous=NORMAL')
+    return conn
+
+def _file_key():
+    # a commit touches words.db or its write-ahead log; stat both
+    key = [str(WORDS_DB)]
+    for p in (WORDS_DB, WORDS_DB.with_name(WORDS_DB.name + '-wal')):
+        try:
+            st = p.stat()
+        except FileNotFoundError:
+            key.append(None)
+        else:
+            key.append((st.st_mtime_ns, st.st_size))
+    return tuple(key)
+
+def _remember(words):
+    # what is now in the database is what the next load_words() would read
+    _cache['key'] = _file_key()
+    if words is not _cache['data']:
+        _cache['counts'] = None
+        _cache['search'] = None
+        _cache['ids'] = None
+    _cache['data'] = words
+
+def _fresh():
+    # the cache holds what is in words.db: no other process has committed
+    # since this one last read or wrote it
+    return _cache['data'] is not None and _cache['key'] == _file_key()
+
+def _owns(item):
+    # item is an entry of the cached list, not one from an earlier load
+    if _cache['data'] is None:
+        return False
+    if _cache['ids'] is None:
+        _cache['ids'] = {w['id']: w for w in _cache['data']}
+    return _cache['ids'].get(item.get('id')) is item
+
+def _wrote(fresh):
+    # after a commit of ours: re-stamping the key would also absorb commits
+    # from other processes, so only do it if the cache was fresh before
+    _cache['key'] = _file_key() if fresh else None
 
-def save_words(words):
-    ensure_data_dir()
-    with open(WORDS_JSON, 'w', encoding='utf-8') as f:
-        json.dump(words, f, ensure_ascii=False, indent=2)
+def load_words():
+    # Returns the cached list while words.db is unchanged; callers that
+    # mutate entries are expected to save them (save_word).
+    with _cache_lock:
+        if not WORDS_DB.exists() and not WORDS_JSON.exists():
+            return []
+        if not WORDS_DB.exists():
+            _db().close()  # creates it from words.json
+        key = _file_key()
+        if _cache['key'] == key:
+            return _cache['data']
+        with closing(_db()) as conn:
+            data = [_from_row(r) for r in conn.execute('SELECT * FROM words ORDER BY id')]
+        _remember(data)
+        return data
 
-def find_duplicate(words, en, fr):
-    nen, nfr = normalize(en), normalize(fr)
+def save_word(item):
+    # persist one entry's SRS state after an answer
+    with _cache_lock:
+        # a stale copy leaves the cached entry for this id out of date
+        fresh = _fresh() and _owns(item)
+        with closing(_db()) as conn:
+            conn.execute(
+                'UPDATE words SET status=?, ef=?, interval=?, repetitions=?, due=? WHERE id=?',
+                (item['status'], item['ef'], item['interval'], item['repetitions'],
+                 item['_due_ord'], item['id']))
+        _wrote(fresh)
+
+def delete_word(wid):
+    # remove one entry by id; returns False when there was none
+    with _cache_lock:
+        fresh = _fresh()
+        with closing(_db()) as conn:
+            deleted = conn.execute('DELETE FROM words WHERE id=?', (wid,)).rowcount > 0
+        if not (fresh and deleted):
+            _wrote(fresh)
+            return deleted
+        # publish a new list rather than editing the shared one: requests in
+        # other threads may be iterating it or holding its search_index()
+        counts = _cache['counts']
+        if counts is not None:
+            counts = dict(counts)
+        kept = []
+        for w in _cache['data']:
+            if w['id'] != wid:
+                kept.append(w)
+            elif counts is not None:
+                counts[w['status']] -= 1
+        _remember(kept)
+        _cache['counts'] = counts
+        return deleted
+
+def _insert_words(words, entries):
+    # store newly appended entries of words without rewriting the rest
+    with _cache_lock:
+        fresh = _fresh() and words is _cache['data']
+        with closing(_db()) as conn:
+            conn.execute('BEGIN')
+            conn.executemany(_INSERT, [_row(w) for w in entries])
+            conn.execute('COMMIT')
+        _wrote(fresh)
+
+def _tally(words):
+    counts = {'new': 0, 'learning': 0, 'validated': 0}
     for w in words:
-        if normalize(w.get('en','')) == nen and normalize(w.get('fr','')) == nfr:
-            return True
-    return False
+        s = w.get('status', 'new')
+        counts[s] = counts.get(s, 0) + 1
+    return counts
+
+def status_counts(words):
+    # counts by status; O(1) for the cached list after the first call.
+    # Built under the lock so writers can't change the list halfway through.
+    with _cache_lock:
+        if words is _cache['data']:
+            if _cache['counts'] is None:
+                _cache['counts'] = _tally(words)
+            return _cache['counts']
+    return _tally(words)
+
+def _index(words):
+    # en and fr are joined by a newline, which normalized queries never contain
+    return [(w['_en_norm'] + '\n' + w['_fr_norm'], i) for i, w in enumerate(words)]
+
+def search_index(words):
+    # (normalized text, position) pairs for substring search; cached for the
+    # cached list, built under the lock like status_counts
+    with _cache_lock:
+        if words is _cache['data']:
+            if _cache['search'] is None:
+                _cache['search'] = _index(words)
+            return _cache['search']
+    return _index(words)
+
+def _set_status(item, status):
+    # move item between buckets of the cached counts, which only describe
+    # entries of the cached list; other dicts leave them alone
+    with _cache_lock:
+        old = item.get('status', 'new')
+        counts = _cache['counts']
+        if counts is not None and old != status and _owns(item):
+            counts[old] -= 1
+            counts[status] = counts.get(status, 0) + 1
+        item['status'] = status
+
+
+# Numba kernel for levenshtein(), compiled on first use so importing the CLI
+# doesn't pay for the JIT stack; False once numba is known to be missing
+_lev_nb = None
+np = None
+
+def _lev_kernel():
+    global _lev_nb, np
+    if _lev_nb is not None:
+        return _lev_nb
+    try:
+        import numpy as np
+        from numba import int32, njit, uint8
+    except ImportError:  # optional speedup
+        _lev_nb = False
+        return _lev_nb
+
+    @njit(int32(uint8[:], uint8[:]), cache=True)
+    def kernel(a, b):
+        # single row buffer; diag holds the north-west cell of the old row
+        la, lb = a.shape[0], b.shape[0]
+        prev = np.empty(lb + 1, dtype=np.int32)
+        for j in range(lb + 1):
+            prev[j] = j
+        for i in range(la):
+            diag = prev[0]
+            left = i + 1
+            prev[0] = left
+            for j in range(1, lb + 1):
+                cost = 0 if a[i] == b[j-1] else 1
+                curr = min(prev[j] + 1, left + 1, diag + cost)
+                diag = prev[j]
+                prev[j] = curr
+                left = curr
+        return prev[lb]
+
+    _lev_nb = kernel
+    return _lev_nb
+
+
+def _ascii_array(s: str):
+    # bytearray keeps the buffer writable, matching the uint8[:] signature
+    return np.frombuffer(bytearray(s.encode('ascii')), dtype=np.uint8)
 
 
 def levenshtein(a: str, b: str) -> int:
@@ -74,6 +406,8 @@ def levenshtein(a: str, b: str) -> int:
         return lb
     if lb == 0:
         return la
+    if a.isascii() and b.isascii() and _lev_kernel():
+        return int(_lev_nb(_ascii_array(a), _ascii_array(b)))
     prev = list(range(lb + 1))
     for i, ca in enumerate(a, start=1):
         curr = [i] + [0] * lb
@@ -86,30 +420,94 @@ def levenshtein(a: str, b: str) -> int:
     return prev[lb]
 
 
-def similar_enough(given: str, expected: str) -> bool:
-    # allow small typos: threshold = 30% of length
+def levenshtein_bounded(a: str, b: str, max_dist: int) -> int:
+    # Ukkonen-style banded Levenshtein: only cells with |i-j| <= max_dist can
+    # stay within budget. Returns max_dist + 1 once the distance provably
+    # exceeds max_dist.
+    if a == b:
+        return 0
+    la, lb = len(a), len(b)
+    over = max_dist + 1
+    if abs(la - lb) > max_dist:
+        return over
+    if la == 0 or lb == 0:
+        return max(la, lb)
+    if a.isascii() and b.isascii() and _lev_kernel():
+        # the native full DP beats a banded Python loop on short words
+        return min(levenshtein(a, b), over)
+    prev = [j if j <= max_dist else over for j in range(lb + 1)]
+    for i, ca in enumerate(a, start=1):
+        curr = [over] * (lb + 1)
+        if i <= max_dist:
+            curr[0] = i
+        row_min = curr[0]
+        for j in range(max(1, i - max_dist), min(lb, i + max_dist) + 1):
+            d = min(prev[j] + 1, curr[j-1] + 1, prev[j-1] + (ca != b[j-1]))
+            if d > over:
+                d = over
+            curr[j] = d
+            if d < row_min:
+                row_min = d
+        if row_min > max_dist:
+            return over
+        prev = curr
+    return prev[lb]
+
+
+def similar_enough(given: str, expected) -> bool:
+    # expected: raw text, or the precomputed _prep_alts() list of an entry
+    if isinstance(expected, str):
+        expected = _prep_alts(expected)
     g = normalize(given)
-    e = normalize(expected)
     # consider comma-separated alternatives
-    for alt in [a.strip() for a in expected.split(',')]:
-        alt_n = normalize(alt)
-        if not alt_n:
-            continue
+    for alt_n, thr in expected:
         if g == alt_n:
             return True
-        d = levenshtein(g, alt_n)
-        thr = max(1, int(len(alt_n) * 0.3))
+        if _sz_edit_distance is not None and g.isascii() and alt_n.isascii():
+            # SIMD edit distance on bytes; accents are stripped by normalize so
+            # this is the common case, and bytes == characters for ASCII
+            d = _sz_edit_distance(g.encode('utf-8'), alt_n.encode('utf-8'))
+        else:
+            d = levenshtein_bounded(g, alt_n, thr)
         if d <= thr:
             return True
     return False
 
+def _pair_key(w):
+    return (w['_en_norm'], w['_fr_norm'])
+
+def _add_new(words, rows):
+    # append (en, fr) rows whose normalized pair isn't present yet, checked
+    # against a set built once, not a rescan of words per row; returns the
+    # appended entries
+    existing = {_pair_key(w) for w in words}
+    # ids are primary keys: continue after the highest, len() may collide
+    next_id = max((w['id'] for w in words), default=0) + 1
+    added = []
+    for en, fr in rows:
+        entry = _prepare({"id": next_id, "en": en, "fr": fr, "status": "new"})
+        key = _pair_key(entry)
+        if key in existing:
+            continue
+        existing.add(key)
+        added.append(entry)
+        next_id += 1
+    # appended under the lock, so status_counts() can't tally it halfway
+    with _cache_lock:
+        words.extend(added)
+        if added and words is _cache['data']:
+            if _cache['counts'] is not None:
+                _cache['counts']['new'] = _cache['counts'].get('new', 0) + len(added)
+            _cache['search'] = None
+            _cache['ids'] = None
+    return added
+
 def import_text(filepath: str):
     path = Path(filepath)
     if not path.exists():
         print(f"File not found: {filepath}")
         return
-    words = load_words()
-    added = 0
+    rows = []
     with open(path, 'r', encoding='utf-8') as f:
         for line in f:
             line = line.strip()
@@ -125,34 +523,33 @@ def import_text(filepath: str):
             if not en or not fr:
                 print(f"Skipping (empty side): {line}")
                 continue
-            if find_duplicate(words, en, fr):
-                continue
-            entry = {"id": len(words)+1, "en": en, "fr": fr, "status": "new"}
-            words.append(entry)
-            added += 1
-    save_words(words)
-    print(f"Imported {added} entries. Total now: {len(words)}")
+            rows.append((en, fr))
+    words = load_words()
+    added = _add_new(words, rows)
+    _insert_words(words, added)
+    print(f"Imported {len(added)} entries. Total now: {len(words)}")
 
 def stats():
     words = load_words()
     total = len(words)
-    validated = sum(1 for w in words if w.get('status') == 'validated')
-    new = sum(1 for w in words if w.get('status') == 'new')
+    counts = status_counts(words)
+    validated = counts['validated']
+    new = counts['new']
     learning = total - validated - new
     print(f"Total: {total}  Validated: {validated}  New: {new}  Learning: {learning}")
 
-def match_answer(given: str, expected: str) -> bool:
+def match_answer(given: str, expected) -> bool:
     # Use permissive matching (normalization + levenshtein tolerance)
+    if _match_answer_c is not None:
+        if isinstance(expected, str):
+            expected = _prep_alts(expected)
+        return _match_answer_c(normalize(given), expected)
     return similar_enough(given, expected)
 
 
-def sm2_update(item: dict, correct: bool):
-    # implement simplified SM-2 algorithm
-    # fields: ef (float), interval (days int), repetitions (int), due (ISO date)
-    ef = float(item.get('ef', 2.5))
-    interval = int(item.get('interval', 0))
-    reps = int(item.get('repetitions', 0))
-    today = date.today()
+def _sm2_step(reps: int, ef: float, correct: bool):
+    # one simplified SM-2 transition -> (repetitions, ef, interval); interval
+    # is None when it scales with the previous one (previous interval * ef)
     if correct:
         quality = 5  # since input is binary, assume perfect when correct
         reps += 1
@@ -161,7 +558,7 @@ def sm2_update(item: dict, correct: bool):
         elif reps == 2:
             interval = 6
         else:
-            interval = max(1, round(interval * ef))
+            interval = None
         # update ef
         ef = ef + (0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02))
         if ef < 1.3:
@@ -170,17 +567,46 @@ def sm2_update(item: dict, correct: bool):
         # wrong answer: reset repetitions
         reps = 0
         interval = 1
-        quality = 2
         ef = max(1.3, ef - 0.2)
-    item['ef'] = round(ef, 2)
-    item['interval'] = int(interval)
+    return reps, round(ef, 2), interval
+
+
+# grading is binary, so from the usual states (ef on a tenth between 1.3 and
+# 3.0) only a few transitions are reachable: precompute them all
+_SM2_TABLE = {
+    (reps, ef10, correct): _sm2_step(reps, ef10 / 10, correct)
+    for reps in range(21)
+    for ef10 in range(13, 31)
+    for correct in (True, False)
+}
+
+
+def sm2_update(item: dict, correct: bool):
+    # implement simplified SM-2 algorithm
+    # fields: ef (float), interval (days int), repetitions (int), due (ISO date)
+    ef = float(item.get('ef', 2.5))
+    interval = int(item.get('interval', 0))
+    reps = int(item.get('repetitions', 0))
+    today = date.today()
+    ef10 = round(ef * 10)
+    step = _SM2_TABLE.get((reps, ef10, correct)) if ef10 / 10 == ef else None
+    if step is None:
+        # off-table state (hand-edited ef, long streaks): compute directly
+        step = _sm2_step(reps, ef, correct)
+    reps, new_ef, new_interval = step
+    if new_interval is None:
+        new_interval = max(1, round(interval * ef))
+    item['ef'] = new_ef
+    item['interval'] = int(new_interval)
     item['repetitions'] = int(reps)
-    item['due'] = (today + timedelta(days=interval)).isoformat()
+    due_ord = today.toordinal() + new_interval
+    item['_due_ord'] = due_ord
+    item['due'] = date.fromordinal(due_ord).isoformat()
     # status update
     if correct:
-        item['status'] = 'validated' if reps >= 3 else 'learning'
+        _set_status(item, 'validated' if reps >= 3 else 'learning')
     else:
-        item['status'] = 'learning'
+        _set_status(item, 'learning')
 
 
 def quiz_loop(due_only=False, only_wrong=False):
@@ -188,19 +614,14 @@ def quiz_loop(due_only=False, only_wrong=False):
     if not words:
         print("No words loaded. Import a file first.")
         return
-    today = date.today()
+    today = date.today().toordinal()
     # select pool based on flags
     pool = []
     for w in words:
         if only_wrong and w.get('status') != 'learning':
             continue
-        if due_only:
-            try:
-                due = datetime.fromisoformat(w.get('due')).date()
-            except Exception:
-                due = today
-            if due > today:
-                continue
+        if due_only and w['_due_ord'] > today:
+            continue
         if w.get('status') == 'validated' and not only_wrong:
             # still allow validated words if only_wrong not set
             continue
@@ -211,16 +632,20 @@ def quiz_loop(due_only=False, only_wrong=False):
         return
 
     random.shuffle(pool)
+    # deque: O(1) popleft/append for the requeue cycle below
+    pool = deque(pool)
     print("Starting quiz. Type :exit to quit, :skip to requeue, :show to reveal, :stats for progress.")
     while pool:
-        w = pool.pop(0)
+        w = pool.popleft()
         direction = random.choice(['en2fr', 'fr2en'])
         if direction == 'en2fr':
-            prompt = f"Translate to French: {w['en']}\n> "
+            prompt = w['_p_en2fr']
             expected = w['fr']
+            alts = w['_fr_alts']
         else:
-            prompt = f"Translate to English: {w['fr']}\n> "
+            prompt = w['_p_fr2en']
             expected = w['en']
+            alts = w['_en_alts']
 
         answer = input(prompt).strip()
         if not answer:
@@ -241,7 +666,7 @@ def quiz_loop(due_only=False, only_wrong=False):
             pool.append(w)
             continue
 
-        correct = match_answer(answer, expected)
+        correct = match_answer(answer, alts)
         if correct:
             print("Correct! ✅")
         else:
@@ -249,15 +674,14 @@ def quiz_loop(due_only=False, only_wrong=False):
 
         # update SRS and statuses
         sm2_update(w, correct)
-        # persist
-        save_words(words)
+        # persist: a single-row update
+        save_word(w)
 
         # if wrong, requeue
         if not correct:
             pool.append(w)
 
-    print("Quiz ended. Saving progress.")
-    save_words(words)
+    print("Quiz ended.")
 
 def list_words():
     words = load_words()
@@ -270,8 +694,7 @@ def import_csv(filepath: str):
     if not path.exists():
         print(f"File not found: {filepath}")
         return
-    words = load_words()
-    added = 0
+    rows = []
     with open(path, newline='', encoding='utf-8') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
@@ -279,13 +702,11 @@ def import_csv(filepath: str):
             fr = row.get('fr') or row.get('french') or row.get('French') or ''
             if not en or not fr:
                 continue
-            if find_duplicate(words, en, fr):
-                continue
-            entry = {"id": len(words)+1, "en": en.strip(), "fr": fr.strip(), 'status': 'new', 'ef': 2.5, 'interval': 0, 'repetitions': 0, 'due': date.today().isoformat()}
-            words.append(entry)
-            added += 1
-    save_words(words)
-    print(f"Imported {added} entries from CSV. Total now: {len(words)}")
+            rows.append((en.strip(), fr.strip()))
+    words = load_words()
+    added = _add_new(words, rows)
+    _insert_words(words, added)
+    print(f"Imported {len(added)} entries from CSV. Total now: {len(words)}")
 
 
 def export_csv(filepath: str):
@@ -299,11 +720,20 @@ def export_csv(filepath: str):
             writer.writerow({k: w.get(k, '') for k in fieldnames})
     print(f"Exported {len(words)} entries to {filepath}")
 
+def export_json(filepath: str):
+    words = load_words()
+    _write_json(Path(filepath), words)
+    print(f"Exported {len(words)} entries to {filepath}")
+
 def reset_progress():
     words = load_words()
-    for w in words:
-        w['status'] = 'new'
-    save_words(words)
+    with _cache_lock:
+        fresh = _fresh() and words is _cache['data']
+        for w in words:
+            _set_status(w, 'new')
+        with closing(_db()) as conn:
+            conn.execute("UPDATE words SET status='new'")
+        _wrote(fresh)
     print("All words reset to 'new'.")
 
 def main():
@@ -314,6 +744,8 @@ def main():
     sub.add_parser('import_csv', help='Import vocabulary from CSV file')
     exp = sub.add_parser('export_csv', help='Export vocabulary to CSV file')
     exp.add_argument('file')
+    expj = sub.add_parser('export_json', help='Export vocabulary and progress to a JSON file')
+    expj.add_argument('file')
     quiz = sub.add_parser('quiz', help='Start interactive quiz')
     quiz.add_argument('--due-only', action='store_true', help='Only quiz items due today or earlier')
     quiz.add_argument('--only-wrong', action='store_true', help='Only quiz items marked as learning')
@@ -331,6 +763,8 @@ def main():
         import_csv(parsed.file)
     elif args.cmd == 'export_csv':
         export_csv(args.file)
+    elif args.cmd == 'export_json':
+        export_json(args.file)
     elif args.cmd == 'quiz':
         # pass flags to quiz_loop
         # args may contain due_only and only_wrong
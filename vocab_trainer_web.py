@@ -2,13 +2,13 @@
 """Minimal Flask web UI for the vocab trainer.
 
 Run: FLASK_APP=vocab_trainer_web.py flask run --port 5001
-or: python3 vocab_trainer_web.py
+or: python3 vocab_trainer_web.py  (uses waitress when FLASK_DEBUG=0 and it is installed)
 """
 from flask import Flask, request, redirect, url_for, render_template, flash, send_file, jsonify
 import os
 import json
 from pathlib import Path
-from vocab_trainer import load_words, save_words, import_text, sm2_update, match_answer, export_csv, reset_progress
+from vocab_trainer import load_words, save_word, delete_word, import_text, sm2_update, match_answer, export_csv, reset_progress, status_counts, search_index, normalize
 from datetime import date
 import random
 
@@ -22,9 +22,11 @@ ROOT = Path(__file__).resolve().parent
 def index():
     words = load_words()
     total = len(words)
-    validated = sum(1 for w in words if w.get('status') == 'validated')
-    learning = sum(1 for w in words if w.get('status') == 'learning')
-    due = sum(1 for w in words if w.get('due','') <= date.today().isoformat())
+    counts = status_counts(words)
+    validated = counts['validated']
+    learning = counts['learning']
+    today = date.today().toordinal()
+    due = sum(1 for w in words if w['_due_ord'] <= today)
     return render_template('index.html', total=total, validated=validated, learning=learning, due=due)
 
 
@@ -61,17 +63,18 @@ def web_list():
     page = int(request.args.get('page','1') or 1)
     per_page = 20
 
-    # filter
+    # filter positions, not entries: one pass over the cached normalized index
     if q:
-        filtered = [w for w in words if q in w.get('en','').lower() or q in w.get('fr','').lower()]
+        nq = normalize(q)
+        ids = [i for text, i in search_index(words) if nq in text]
     else:
-        filtered = words
+        ids = range(len(words))
 
     # filter by status if requested (e.g. ?status=learning)
     if status:
-        filtered = [w for w in filtered if w.get('status') == status]
+        ids = [i for i in ids if words[i].get('status') == status]
 
-    total = len(filtered)
+    total = len(ids)
     page_count = max(1, (total + per_page - 1) // per_page)
     if page < 1:
         page = 1
@@ -80,7 +83,7 @@ def web_list():
 
     start = (page - 1) * per_page
     end = start + per_page
-    page_items = filtered[start:end]
+    page_items = [words[i] for i in ids[start:end]]
 
     # build a base query string to preserve q/status in pagination links
     parts = []
@@ -109,14 +112,10 @@ def web_word_delete():
         flash('Invalid id for deletion.')
         return redirect(request.referrer or url_for('web_list'))
 
-    words = load_words()
-    before = len(words)
-    words = [w for w in words if w.get('id') != wid]
-    if len(words) == before:
+    if not delete_word(wid):
         flash('Item not found; nothing deleted.')
         return redirect(request.referrer or url_for('web_list'))
 
-    save_words(words)
     flash(f'Deleted item {wid}.')
 
     # preserve filters/pagination if provided
@@ -139,19 +138,14 @@ def web_quiz_get():
     # support query params for due_only and only_wrong
     due_only = request.args.get('due_only') == '1'
     only_wrong = request.args.get('only_wrong') == '1'
-    today = date.today()
+    today = date.today().toordinal()
     # build candidate list based on filters
     candidates = []
     for w in words:
         if only_wrong and w.get('status') != 'learning':
             continue
-        if due_only:
-            try:
-                due = date.fromisoformat(w.get('due'))
-            except Exception:
-                due = today
-            if due > today:
-                continue
+        if due_only and w['_due_ord'] > today:
+            continue
         if w.get('status') == 'validated' and not only_wrong:
             continue
         candidates.append(w)
@@ -210,9 +204,9 @@ def web_quiz_post():
         return redirect(url_for('web_quiz_get', dir=direction))
 
     # default: answer submission
-    correct = match_answer(answer, expected)
+    correct = match_answer(answer, item['_fr_alts'] if direction == 'en2fr' else item['_en_alts'])
     sm2_update(item, correct)
-    save_words(words)
+    save_word(item)
     # pass back the direction so result page links preserve it
     return render_template('result.html', item=item, correct=correct, expected=expected, dir=direction)
 
@@ -221,9 +215,10 @@ def web_quiz_post():
 def web_stats():
     words = load_words()
     total = len(words)
-    validated = sum(1 for w in words if w.get('status') == 'validated')
-    learning = sum(1 for w in words if w.get('status') == 'learning')
-    new = sum(1 for w in words if w.get('status') == 'new')
+    counts = status_counts(words)
+    validated = counts['validated']
+    learning = counts['learning']
+    new = counts['new']
     return render_template('stats.html', total=total, validated=validated, learning=learning, new=new)
 
 
@@ -231,12 +226,8 @@ def web_stats():
 def api_status_counts():
     """Return JSON counts by status for client-side charts."""
     words = load_words()
-    counts = {'new': 0, 'learning': 0, 'validated': 0}
-    for w in words:
-        s = w.get('status', 'new')
-        if s not in counts:
-            counts[s] = 0
-        counts[s] += 1
+    # copy: status_counts() returns the shared cached dict
+    counts = dict(status_counts(words))
     counts['total'] = len(words)
     return jsonify(counts)
 
@@ -249,4 +240,13 @@ if __name__ == '__main__':
     debug_env = os.environ.get('FLASK_DEBUG')
     debug = True if debug_env is None else (debug_env not in ('0', 'false', 'False'))
     print(f"Starting server on {host}:{port} (debug={debug})")
-    app.run(host=host, port=port, debug=debug)
+    if debug:
+        app.run(host=host, port=port, debug=debug)
+    else:
+        # production: serve from a pool of threads sharing one cached word list
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(host=host, port=port, debug=False, threaded=True)
+        else:
+            serve(app, host=host, port=port, threads=8)